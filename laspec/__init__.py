@@ -1,5 +1,40 @@
+import importlib
 import os
-from .ccf import RVM
-from .mrs import MrsSpec, MrsEpoch, MrsFits, MrsSource, SOL_kms
+
+from ._version import __version__
 
 PACKAGE_PATH = os.path.dirname(__file__)
+
+# public names and their submodules, imported on first access (PEP 562)
+# so that `import laspec` does not load numpy/scipy/astropy
+_LAZY_ATTRS = {
+    "RVM": "ccf",
+    "MrsSpec": "mrs",
+    "MrsEpoch": "mrs",
+    "MrsFits": "mrs",
+    "MrsSource": "mrs",
+    "SOL_kms": "mrs",
+}
+
+# submodules that `from .ccf import RVM` etc. used to load on `import laspec`,
+# others, e.g., laspec.slam which needs torch, are imported explicitly
+_LAZY_SUBMODULES = ("ccf", "extern", "mrs", "normalization", "time")
+
+__all__ = ["__version__", "PACKAGE_PATH", *_LAZY_ATTRS]
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module("." + _LAZY_ATTRS[name], __name__)
+        value = getattr(module, name)
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module("." + name, __name__)
+    else:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    # cache it, later lookups do not come here
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | set(_LAZY_SUBMODULES))
@@ -0,0 +1 @@
+__version__ = "2024.11.26"
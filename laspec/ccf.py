@@ -5,6 +5,8 @@ RVM without weights.
 Vectorized functions
 --------------------
 xcorr_spec_vectorized(rv_grid, wave_obs, flux_obs, wave_mod, flux_mod)
+xcorr_spec_rvgrid_batch(wave_obs, flux_obs, wave_mod, flux_mod, rv_grid)
+├── RVM.measure
 
 
 Un-vectorized functions
@@ -15,7 +17,6 @@ cov(x1, x2)
 |    |   ├── xcorr_spec_cost(rv, wave_obs, flux_obs, wave_mod, flux_mod)-> float
 |    |   ├── xcorr_spec_rvgrid
 |    |       ├── RVM.ccf_1mod
-|    |       ├── RVM.measure
 |    |       ├── RVM.measure_pw
 |    ├── xcorr_spec_twin(rv1, drv, eta, wave_obs, flux_obs, wave_mod, flux_mod) -> float
 |    ├── xcorr_spec_twin_gamma
@@ -132,7 +133,7 @@ def xcorr_spec_vectorized(
     nmod = flux_mod.shape[0]
     nrv = len(rv_grid)
     # make model cube
-    flux_mod_interp = np.zeros((nmod, nrv, npix), dtype=float)
+    flux_mod_interp = np.empty((nmod, nrv, npix), dtype=float)
     for imod in range(nmod):
         for irv in range(nrv):
             flux_mod_interp[imod, irv, :] = np.interp(
@@ -150,6 +151,53 @@ def xcorr_spec_vectorized(
     return ccf_grid
 
 
+def xcorr_spec_rvgrid_batch(
+    wave_obs: npt.NDArray,
+    flux_obs: npt.NDArray,
+    wave_mod: npt.NDArray,
+    flux_mod: npt.NDArray,
+    rv_grid: npt.NDArray,
+) -> npt.NDArray:
+    """Cross-correlation of all templates at an `rv_grid`, (nmod, nrv).
+
+    Same as `xcorr_spec_rvgrid` for each row of `flux_mod`, but the loop is
+    over RV only: the interpolation weights of a shifted grid are shared by
+    all templates, and their CCFs are evaluated in one matrix product.
+    """
+    wave_obs = np.asarray(wave_obs)
+    wave_mod = np.asarray(wave_mod)
+    rv_grid = construct_rv_grid(rv_grid)
+    # interpolate in float64 as np.interp does, whatever the template dtype
+    flux_obs = np.asarray(flux_obs, dtype=float)
+    flux_mod = np.asarray(flux_mod, dtype=float)
+    nmod = flux_mod.shape[0]
+    nrv = len(rv_grid)
+    res0 = flux_obs - np.mean(flux_obs)
+    # underscore means it is not normalized
+    _cov00 = np.sum(res0**2.0)  # var(F, F) float
+    ccf_grid = np.empty((nmod, nrv), dtype=float)
+    for irv in range(nrv):
+        wave_mod_rv = wave_mod * (1 + rv_grid[irv] / SOL_kms)
+        # linear interpolation weights, constant extrapolation as np.interp
+        ind = np.clip(
+            np.searchsorted(wave_mod_rv, wave_obs, side="right") - 1,
+            0,
+            len(wave_mod_rv) - 2,
+        )
+        frac = np.clip(
+            (wave_obs - wave_mod_rv[ind]) / (wave_mod_rv[ind + 1] - wave_mod_rv[ind]),
+            0.0,
+            1.0,
+        )
+        flux_mod_interp = flux_mod[:, ind]
+        flux_mod_interp += frac * (flux_mod[:, ind + 1] - flux_mod_interp)
+        res1 = flux_mod_interp - np.mean(flux_mod_interp, axis=1)[:, None]
+        _cov11 = np.sum(res1**2.0, axis=1)  # var(G, G) (nmod,)
+        _cov01 = res1 @ res0  # cov(F, G) (nmod,)
+        ccf_grid[:, irv] = _cov01 / np.sqrt(_cov00) / np.sqrt(_cov11)
+    return ccf_grid
+
+
 def xcorr_spec_twin(
     rv1: float,
     drv: float,
@@ -696,15 +744,9 @@ class RVM:
         elif cache_name is None or cache_name is False:
             # no cache
             rv_grid = construct_rv_grid(rv_grid)
-            ccf_grid = np.zeros((self.flux_mod.shape[0], rv_grid.shape[0]))
-            for imod in range(self.nmod):
-                ccf_grid[imod] = xcorr_spec_rvgrid(
-                    wave_obs=wave_obs,
-                    flux_obs=flux_obs,
-                    wave_mod=self.wave_mod,
-                    flux_mod=self.flux_mod[imod],
-                    rv_grid=rv_grid,
-                )
+            ccf_grid = xcorr_spec_rvgrid_batch(
+                wave_obs, flux_obs, self.wave_mod, self.flux_mod, rv_grid
+            )
         else:
             raise ValueError(
                 "@RVM: invalid cache_name: {}. valid options:{} or matrix".format(
@@ -713,7 +755,6 @@ class RVM:
             )
 
         # CCF max
-        ccf_max = np.max(ccf_grid)
         imod, irv_best = np.unravel_index(np.argmax(ccf_grid), ccf_grid.shape)
         if cache_name in self.cache_names:
             rv_best = self.__getattribute__("rv_grid_cache_{}".format(cache_name))[
@@ -807,7 +848,7 @@ class RVM:
         n_spec = len(wave_obs_list)
 
         # initialize ccf arrays
-        ccf_max_grid = np.zeros(n_spec, int)
+        ccf_max_grid = np.zeros(n_spec, float)
         imod_best_grid = np.zeros(n_spec, int)
         irv_best_grid = np.zeros(n_spec, int)
         if verbose:
@@ -847,10 +888,12 @@ class RVM:
             )
 
             # CCF max
-            ccf_max_grid[i_spec] = np.max(ccf_grid)
             imod_best_grid[i_spec], irv_best_grid[i_spec] = np.unravel_index(
                 np.argmax(ccf_grid), ccf_grid.shape
             )
+            ccf_max_grid[i_spec] = ccf_grid[
+                imod_best_grid[i_spec], irv_best_grid[i_spec]
+            ]
 
         # select the best template
         imod_selected = imod_best_grid[np.argmax(ccf_max_grid)]
@@ -903,8 +946,8 @@ class RVM:
             )
 
             # CCF max
-            ccf_max_grid[i_spec] = np.max(ccf_grid)
             irv_best_grid[i_spec] = np.argmax(ccf_grid)
+            ccf_max_grid[i_spec] = ccf_grid[irv_best_grid[i_spec]]
             rv_best_grid = self.__getattribute__("rv_grid_cache_{}".format(cache_name))[
                 irv_best_grid[i_spec]
             ]
@@ -1272,16 +1315,14 @@ class RVM:
         flux_obs = np.interp(wave_obs, wave_obs[ind3], flux_obs[ind3])
         # CCF grid
         rv_grid = construct_rv_grid(rv_grid)
-        ccf = np.zeros((self.flux_mod.shape[0], rv_grid.shape[0]))
+        ccf = np.empty((self.flux_mod.shape[0], rv_grid.shape[0]))
         for j in range(self.flux_mod.shape[0]):
             ccf[j] = xcorr_spec_rvgrid(
                 wave_obs, flux_obs, self.wave_mod, self.flux_mod[j][1], rv_grid
             )
         # CCF max
-        ccfmax = np.max(ccf)
-        ind_best = np.where(ccfmax == ccf)
-        imod = ind_best[0][0]
-        irv_best = ind_best[1][0]
+        imod, irv_best = np.unravel_index(np.argmax(ccf), ccf.shape)
+        ccfmax = ccf[imod, irv_best]
         rv_best = rv_grid[irv_best]
         # CCF opt
         opt = minimize(
@@ -1,15 +1,27 @@
-__all__ = ["MrsSpec", "MrsEpoch", "MrsFits", "MrsSource", "debad", "SOL_kms"]
+__all__ = [
+    "MrsSpec",
+    "MrsEpoch",
+    "MrsFits",
+    "MrsFitsio",
+    "MrsSource",
+    "debad",
+    "SOL_kms",
+]
 
 import glob
+import importlib.util
 import os
 import warnings
+from functools import lru_cache
 
+import joblib
 import matplotlib.pyplot as plt
 import numpy as np
 from astropy import constants
 from astropy.io import fits
-from astropy.table import Table
-from scipy.signal import medfilt
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.ndimage import binary_dilation, convolve1d
+from scipy.signal import oaconvolve
 from scipy.signal.windows import gaussian
 
 from .normalization import normalize_spectrum_general
@@ -17,11 +29,107 @@ from .time import datetime2jd, jd2bjd
 
 SOL_kms = constants.c.value / 1000.0
 
+# kernel width above which debad convolves with FFT (overlap-add)
+_OACONVOLVE_MIN_WIDTH = 150
+
+# per-spectrum fields of MrsEpoch, accessed as, e.g., flux_norm_B
+_SPEC_FIELDS = (
+    "wave",
+    "flux",
+    "ivar",
+    "mask",
+    "flux_err",
+    "flux_norm",
+    "ivar_norm",
+    "flux_cont",
+    "flux_norm_err",
+)
+
+# shared read-only empty arrays for null spectra, do not modify them in place
+_EMPTY_F64 = np.empty(0, dtype=float)
+_EMPTY_B = np.empty(0, dtype=bool)
+_EMPTY_F64.setflags(write=False)
+_EMPTY_B.setflags(write=False)
+
 warnings.filterwarnings("ignore")
 
 
+@lru_cache(maxsize=4096)
+def _datetime2jd(datetime, format="isot", tz_correction=8):
+    """cached datetime2jd, B & R HDUs of an epoch share the same DATE-* strings"""
+    return datetime2jd(datetime, format=format, tz_correction=tz_correction)
+
+
+@lru_cache(maxsize=8)
+def _normed_gaussian(m, std):
+    """normalized gaussian kernel, cached and read-only"""
+    gk = gaussian(m, std)
+    gk /= np.sum(gk)
+    gk.setflags(write=False)
+    return gk
+
+
+def _medfilt1d(flux, width=21):
+    """1D median filter, equivalent to scipy.signal.medfilt(flux, width)
+
+    The input is zero-padded as in *medfilt*, but the median of each window
+    is selected with np.partition over a strided view, which is much faster
+    than the generic N-D implementation for narrow windows.
+    """
+    if width % 2 == 0:
+        raise ValueError("@_medfilt1d: width should be odd!")
+    half = width // 2
+    windows = sliding_window_view(np.pad(flux, half), width)
+    return np.partition(windows, half, axis=1)[:, half]
+
+
+def _convolve_same(x, kernel, output):
+    """np.convolve(x, kernel, "same") written into a preallocated output
+
+    Direct convolution is faster for narrow kernels such as the default
+    gfarg=(51, 9), the overlap-add FFT takes over for wider kernels.
+    """
+    if len(kernel) > _OACONVOLVE_MIN_WIDTH:
+        output[:] = oaconvolve(x, kernel, mode="same")
+        return output
+    return convolve1d(
+        x, kernel, output=output, mode="constant", origin=len(kernel) % 2 - 1
+    )
+
+
+def _debad_clip(
+    fluxnorm, mfarg, gk_small, gk_sigma, nsigma_lo, nsigma_hi, scratch, indout
+):
+    """one clipping pass of *debad*, write the mask of outliers to indout
+
+    scratch is a (3, npix) float buffer holding the residuals, the sigma
+    envelope and a temporary array, so that no array is allocated per pass.
+    """
+    fluxres, fluxsigma, fluxtmp = scratch
+    # median filter + gaussian filter
+    _convolve_same(_medfilt1d(fluxnorm, mfarg), gk_small, output=fluxres)
+    # residuals
+    np.subtract(fluxnorm, fluxres, out=fluxres)
+    # gaussian filter --> sigma
+    np.abs(fluxres, out=fluxtmp)
+    _convolve_same(fluxtmp, gk_sigma, output=fluxsigma)
+    # clip
+    np.multiply(fluxsigma, nsigma_lo, out=fluxtmp)
+    np.greater(fluxres, fluxtmp, out=indout)
+    np.multiply(fluxsigma, -nsigma_hi, out=fluxtmp)
+    indout |= fluxres < fluxtmp
+    return indout
+
+
 def debad(
-    wave, fluxnorm, nsigma=(4, 8), mfarg=21, gfarg=(51, 9), maskconv=7, maxiter=3
+    wave,
+    fluxnorm,
+    nsigma=(4, 8),
+    mfarg=21,
+    gfarg=(51, 9),
+    maskconv=7,
+    maxiter=3,
+    return_mask=False,
 ):
     """
     Parameters
@@ -40,62 +148,84 @@ def debad(
         mask convolution --> cushion
     maxiter:
         max iteration
+    return_mask:
+        if True, also return the mask of replaced pixels
 
     Return
     ------
-    fluxnorm
+    fluxnorm, (indrep)
     """
+    # gaussian kernels are loop-invariant and cached across calls
+    gk_small = _normed_gaussian(5, 0.5)
+    gk_sigma = _normed_gaussian(*gfarg)
+    fluxnorm, indrep = _debad_core(
+        wave, fluxnorm, *nsigma, mfarg, gk_small, gk_sigma, maskconv, maxiter
+    )
+    if return_mask:
+        return fluxnorm, indrep
+    return fluxnorm
+
+
+def _debad_core(
+    wave, fluxnorm, nsigma_lo, nsigma_hi, mfarg, gk_small, gk_sigma, maskconv, maxiter
+):
+    """the iterations of *debad* with prepared kernels, return fluxnorm, indrep"""
     npix = len(fluxnorm)
-    indclip = np.zeros_like(fluxnorm, dtype=bool)
+    indclip = np.zeros(npix, dtype=bool)
+    indrep = np.zeros(npix, dtype=bool)
+    # scratch buffers reused in all iterations
+    scratch = np.empty((3, npix), dtype=float)
+    indout = np.empty(npix, dtype=bool)
+    inddil = np.empty(npix, dtype=bool)
+    structure = np.ones(maskconv, dtype=bool)
+    # the origin aligns even widths with np.convolve
+    origin = maskconv % 2 - 1
+    nbad_max = 0.5 * npix
     countiter = 0
     while True:
-        # median filter
-        fluxmf = medfilt(fluxnorm, mfarg)
-        # gaussian filter
-        gk = gaussian(5, 0.5)
-        gk /= np.sum(gk)
-        fluxmf = np.convolve(fluxmf, gk, "same")
-        # residuals
-        fluxres = fluxnorm - fluxmf
-        # gaussian filter --> sigma
-        gk = gaussian(*gfarg)
-        gk /= np.sum(gk)
-        fluxsigma = np.convolve(np.abs(fluxres), gk, "same")
         # clip
-        indout = np.logical_or(
-            fluxres > fluxsigma * nsigma[0], fluxres < -fluxsigma * nsigma[1]
+        _debad_clip(
+            fluxnorm, mfarg, gk_small, gk_sigma, nsigma_lo, nsigma_hi, scratch, indout
         )
         indclip |= indout
-        if np.sum(indclip) > 0.5 * npix:
+        if np.count_nonzero(indclip) > nbad_max:
             raise RuntimeError("Too many bad pixels!")
         countiter += 1
-        if np.sum(indout) == 0 or countiter >= maxiter:
-            return fluxnorm
+        if not indout.any() or countiter >= maxiter:
+            return fluxnorm, indrep
         else:
-            indout = np.convolve(indout * 1.0, np.ones((maskconv,)), "same") > 0
-            fluxnorm = np.interp(wave, wave[~indout], fluxnorm[~indout])
+            # dilate the mask
+            binary_dilation(indout, structure=structure, output=inddil, origin=origin)
+            # interpolate the bad pixels only, on a copy of the input
+            if countiter == 1:
+                fluxnorm = np.array(fluxnorm, dtype=float)
+            indrep |= inddil
+            indbad = np.flatnonzero(inddil)
+            indgood = np.flatnonzero(~inddil)
+            fluxnorm[indbad] = np.interp(wave[indbad], wave[indgood], fluxnorm[indgood])
 
 
 class MrsSpec:
     """MRS spectrum"""
 
+    # attributes set in every __init__ are slots, __dict__ keeps the
+    # header info and other attributes set on the fly
+    __slots__ = _SPEC_FIELDS + (
+        "isempty",
+        "npix_bad",
+        "norm_type",
+        "norm_kwargs",
+        "info",
+        "lmjmlist",
+        "__dict__",
+    )
+
     name = ""
-    # original quantities
-    wave = np.array([], dtype=float)
-    flux = np.array([], dtype=float)
-    ivar = np.array([], dtype=float)
-    mask = np.array([], dtype=bool)  # True for problematic
-    flux_err = np.array([], dtype=float)
-    indcr = np.array([], dtype=float)  # cosmic ray index
-
-    # normalized quantities
-    flux_norm = np.array([], dtype=float)
-    flux_cont = np.array([], dtype=float)
-    ivar_norm = np.array([], dtype=float)
-    flux_norm_err = np.array([], dtype=float)
+    # original quantities: wave, flux, ivar, mask (True for problematic), flux_err
+    indcr = _EMPTY_B  # cosmic ray index
+    # normalized quantities: flux_norm, flux_cont, ivar_norm, flux_norm_err
 
     # other information (optional)
-    info = {}
     rv = 0.0
 
     # time and position info
@@ -103,7 +233,6 @@ class MrsSpec:
     snr = 0
     exptime = 0
     lmjm = 0
-    lmjmlist = []
     obsid = 0
     seeing = 0.0
     lamplist = ""
@@ -118,13 +247,8 @@ class MrsSpec:
     bjdmid = 0.0
 
     # status
-    isempty = True
     isnormalized = False
 
-    # default settings for normalize_spectrum_iter / normlize_spectrum_poly
-    norm_type = None
-    norm_kwargs = {}
-
     def meta(self):
         return dict(
             extname=self.extname,
@@ -153,7 +277,7 @@ class MrsSpec:
         flux=None,
         ivar=None,
         mask=None,
-        info={},
+        info=None,
         norm_type="spline",
         **norm_kwargs,
     ):
@@ -176,34 +300,46 @@ class MrsSpec:
             normalization settings passed to normalize_spectrum_general()
         """
         # set data
-        if wave is not None and flux is not None:
-            self.wave, self.flux = wave, flux
-            self.isempty = False
-        else:
-            # a null spec
-            self.wave = np.array([], dtype=float)
-            self.flux = np.array([], dtype=float)
-            self.isempty = True
-        # ivar and mask is optional for spec
-        if ivar is None:
-            self.ivar = np.ones_like(self.flux, dtype=float)
-        else:
-            self.ivar = ivar
-        if mask is None:
-            self.mask = np.zeros_like(self.flux, dtype=bool)
+        if wave is None or flux is None:
+            # a null spec, share the read-only empty arrays
+            self.wave = self.flux = self.ivar = self.flux_err = _EMPTY_F64
+            self.mask = _EMPTY_B
             self.npix_bad = 0
+            self.isempty = True
         else:
-            self.mask = mask
-            self.npix_bad = np.sum(self.mask > 0)
-        # flux_err
-        flux_err = self.ivar**-0.5
-        self.flux_err = np.where(np.isfinite(flux_err), flux_err, np.nan)
+            self.wave, self.flux = wave, flux
+            self.isempty = False
+            # ivar and mask is optional for spec
+            if ivar is None:
+                self.ivar = np.ones_like(self.flux, dtype=float)
+            else:
+                self.ivar = ivar
+            if mask is None:
+                self.mask = np.zeros_like(self.flux, dtype=bool)
+                self.npix_bad = 0
+            else:
+                self.mask = mask
+                self.npix_bad = np.sum(self.mask > 0)
+            # flux_err, NaN for non-positive ivar
+            ind_pos = self.ivar > 0
+            self.flux_err = np.full(
+                np.shape(self.ivar), np.nan, dtype=np.result_type(self.ivar, np.float32)
+            )
+            np.sqrt(self.ivar, out=self.flux_err, where=ind_pos)
+            np.reciprocal(self.flux_err, out=self.flux_err, where=ind_pos)
         # set info
+        self.lmjmlist = []
+        if info is None:
+            info = {}
         for k, v in info.items():
             self.__setattr__(k, v)
         self.info = info
 
         # normalize spectrum
+        self.flux_norm = _EMPTY_F64
+        self.flux_cont = _EMPTY_F64
+        self.ivar_norm = _EMPTY_F64
+        self.flux_norm_err = _EMPTY_F64
         self.norm_type = norm_type
         self.norm_kwargs = norm_kwargs
         if norm_type in ["poly", "spline"]:
@@ -221,114 +357,148 @@ class MrsSpec:
         if hdu is None or hdu.header["EXTNAME"] == "Information":
             return MrsSpec()
         else:
-            # convert to Table
-            spec = Table(hdu.data)
-            if "LOGLAM" in spec.colnames:
-                # this is old format, until DR9 v0
-                spec.sort("LOGLAM")
-                if "COADD" in hdu.name:
-                    # it's coadded spec
-                    wave = 10 ** spec["LOGLAM"].data
-                    flux = spec["FLUX"].data
-                    ivar = spec["IVAR"].data
-                    mask = spec["ORMASK"].data  # use ormask for coadded spec
-                elif hdu.name.startswith("B-") or hdu.name.startswith("R-"):
-                    # it's epoch spec
-                    wave = 10 ** spec["LOGLAM"].data
-                    flux = spec["FLUX"].data
-                    ivar = spec["IVAR"].data
-                    mask = spec["PIXMASK"].data  # use pixmask for epoch spec
-            elif "WAVELENGTH" in spec.colnames:
-                # new format, since DR9 v1
-                if "COADD" in hdu.name:
-                    # it's coadded spec
-                    wave = spec["WAVELENGTH"][0]
-                    flux = spec["FLUX"][0]
-                    ivar = spec["IVAR"][0]
-                    mask = spec["ORMASK"][0]  # use ormask for coadded spec
-                elif hdu.name.startswith("B-") or hdu.name.startswith("R-"):
-                    # it's epoch spec
-                    wave = spec["WAVELENGTH"][0]
-                    flux = spec["FLUX"][0]
-                    ivar = spec["IVAR"][0]
-                    mask = spec["PIXMASK"][0]  # use pixmask for epoch spec
-            else:
-                raise ValueError("@MrsFits: error in reading epoch spec!")
-
-            # get meta info
-            info = dict(
-                name=get_kwd_safe(hdu.header, "EXTNAME", ""),
-                lmjm=int(get_kwd_safe(hdu.header, "LMJM", 0)),
-                exptime=float(get_kwd_safe(hdu.header, "EXPTIME", 0.0)),
-                snr=float(get_kwd_safe(hdu.header, "SNR", 0.0)),
-                lamplist=get_kwd_safe(hdu.header, "LAMPLIST", ""),
+            return MrsSpec.from_data(
+                hdu.data, hdu.header, norm_type=norm_type, **norm_kwargs
             )
 
-            # initiate MrsSpec
-            ms = MrsSpec(
-                wave, flux, ivar, mask, info=info, norm_type=norm_type, **norm_kwargs
-            )
+    @staticmethod
+    def from_data(data, header, norm_type=None, **norm_kwargs):
+        """convert MRS table data and header to spec
 
-            # calculate bjdmid
-            ms.jdbeg = datetime2jd(
-                hdu.header["DATE-BEG"], format="isot", tz_correction=8
-            )
-            ms.jdend = datetime2jd(
-                hdu.header["DATE-END"], format="isot", tz_correction=8
-            )
-            ms.jdmid = (ms.jdbeg + ms.jdend) / 2.0
-            ms.bjdmid = jd2bjd(ms.ra, ms.dec, ms.jdmid)
-            return ms
+        Parameters
+        ----------
+        data:
+            record array with LOGLAM or WAVELENGTH, FLUX, IVAR, ORMASK/PIXMASK
+        header:
+            dict-like header of the HDU, EXTNAME is used to tell the type
+        """
+        name = header["EXTNAME"].upper()
+        # read columns directly, without converting to Table
+        colnames = data.dtype.names
+        if "COADD" in name:
+            mask_key = "ORMASK"  # use ormask for coadded spec
+        elif name.startswith("B-") or name.startswith("R-"):
+            mask_key = "PIXMASK"  # use pixmask for epoch spec
+        if "LOGLAM" in colnames:
+            # this is old format, until DR9 v0
+            order = np.argsort(data["LOGLAM"])
+            wave = 10 ** np.asarray(data["LOGLAM"])[order]
+            flux = np.asarray(data["FLUX"])[order]
+            ivar = np.asarray(data["IVAR"])[order]
+            mask = np.asarray(data[mask_key])[order]
+        elif "WAVELENGTH" in colnames:
+            # new format, since DR9 v1
+            wave = data["WAVELENGTH"][0]
+            flux = data["FLUX"][0]
+            ivar = data["IVAR"][0]
+            mask = data[mask_key][0]
+        else:
+            raise ValueError("@MrsFits: error in reading epoch spec!")
+
+        # get meta info
+        info = dict(
+            name=get_kwd_safe(header, "EXTNAME", ""),
+            lmjm=int(get_kwd_safe(header, "LMJM", 0)),
+            exptime=float(get_kwd_safe(header, "EXPTIME", 0.0)),
+            snr=float(get_kwd_safe(header, "SNR", 0.0)),
+            lamplist=get_kwd_safe(header, "LAMPLIST", ""),
+        )
+
+        # initiate MrsSpec
+        ms = MrsSpec(
+            wave, flux, ivar, mask, info=info, norm_type=norm_type, **norm_kwargs
+        )
+
+        # calculate bjdmid
+        ms.jdbeg = _datetime2jd(header["DATE-BEG"])
+        ms.jdend = _datetime2jd(header["DATE-END"])
+        ms.jdmid = (ms.jdbeg + ms.jdend) / 2.0
+        ms.bjdmid = jd2bjd(ms.ra, ms.dec, ms.jdmid)
+        return ms
 
     @staticmethod
     def from_mrs(fp_mrs, hduname="COADD_B", norm_type=None, **norm_kwargs):
         """read from MRS fits file"""
-        hl = fits.open(fp_mrs)
+        hl = fits.open(fp_mrs, memmap=True, lazy_load_hdus=True)
         ms = MrsSpec.from_hdu(hl[hduname], norm_type=norm_type, **norm_kwargs)
         return ms
 
     @staticmethod
-    def from_lrs(fp_lrs, norm_type="spline", **norm_kwargs):
-        """read from LRS fits file"""
-        hl = fits.open(fp_lrs)
-        hdr = hl[0].header
+    def from_mrs_fitsio(fp_mrs, hduname="COADD_B", norm_type=None, **norm_kwargs):
+        """read from MRS fits file with the optional *fitsio* backend
+
+        Only the requested HDU is read. Fall back to *from_mrs* if *fitsio*
+        is not installed.
+        """
         try:
-            flux, ivar, wave, andmask, ormask = hl[0].data
-        except:
-            # dr9
-            flux = hl[1].data["FLUX"][0]
-            ivar = hl[1].data["IVAR"][0]
-            wave = hl[1].data["WAVELENGTH"][0]
-            # andmask = hl[1].data["ANDMASK"][0]
-            ormask = hl[1].data["ORMASK"][0]
+            import fitsio
+        except ImportError:
+            return MrsSpec.from_mrs(
+                fp_mrs, hduname=hduname, norm_type=norm_type, **norm_kwargs
+            )
+        with fitsio.FITS(fp_mrs) as hl:
+            header = hl[hduname].read_header()
+            data = hl[hduname].read()
+        return MrsSpec.from_data(data, header, norm_type=norm_type, **norm_kwargs)
+
+    @staticmethod
+    def from_lrs(fp_lrs, norm_type="spline", lazy=False, **norm_kwargs):
+        """read from LRS fits file
+
+        Parameters
+        ----------
+        fp_lrs:
+            file path
+        norm_type:
+            normalization type
+        lazy:
+            if True, skip normalization and only keep name, obsid, ra, dec
+            and rv in the info
+        """
+        with fits.open(fp_lrs, memmap=True, lazy_load_hdus=True) as hl:
+            hdr = hl[0].header
+            try:
+                flux, ivar, wave, andmask, ormask = hl[0].data
+            except:
+                # dr9
+                flux = hl[1].data["FLUX"][0]
+                ivar = hl[1].data["IVAR"][0]
+                wave = hl[1].data["WAVELENGTH"][0]
+                # andmask = hl[1].data["ANDMASK"][0]
+                ormask = hl[1].data["ORMASK"][0]
 
         # info
         info = dict(
-            name=hdr["OBSID"],
-            obsid=hdr["OBSID"],
-            ra=hdr["RA"],
-            dec=hdr["DEC"],
-            rv=hdr["Z"] * SOL_kms,
-            rv_err=hdr["Z_ERR"] * SOL_kms,
-            subclass=hdr["SUBCLASS"],
-            tsource=hdr["TSOURCE"],
-            snr=hdr["SNRG"],
-            snru=hdr["SNRU"],
-            snrg=hdr["SNRG"],
-            snrr=hdr["SNRR"],
-            snri=hdr["SNRI"],
-            snrz=hdr["SNRZ"],
+            name=get_kwd_safe(hdr, "OBSID"),
+            obsid=get_kwd_safe(hdr, "OBSID"),
+            ra=get_kwd_safe(hdr, "RA"),
+            dec=get_kwd_safe(hdr, "DEC"),
+            rv=get_kwd_safe(hdr, "Z") * SOL_kms,
         )
+        if lazy:
+            norm_type = None
+        else:
+            info.update(
+                rv_err=get_kwd_safe(hdr, "Z_ERR") * SOL_kms,
+                subclass=get_kwd_safe(hdr, "SUBCLASS", ""),
+                tsource=get_kwd_safe(hdr, "TSOURCE", ""),
+                snr=get_kwd_safe(hdr, "SNRG"),
+                snru=get_kwd_safe(hdr, "SNRU"),
+                snrg=get_kwd_safe(hdr, "SNRG"),
+                snrr=get_kwd_safe(hdr, "SNRR"),
+                snri=get_kwd_safe(hdr, "SNRI"),
+                snrz=get_kwd_safe(hdr, "SNRZ"),
+            )
         ms = MrsSpec(
             wave, flux, ivar, ormask, info=info, norm_type=norm_type, **norm_kwargs
         )
         # calculate bjd
         if hdr["DATE-BEG"] != "" and hdr["DATE-END"] != "":
-            ms.jdbeg = datetime2jd(hdr["DATE-BEG"], format="isot", tz_correction=8)
-            ms.jdend = datetime2jd(hdr["DATE-END"], format="isot", tz_correction=8)
+            ms.jdbeg = _datetime2jd(hdr["DATE-BEG"])
+            ms.jdend = _datetime2jd(hdr["DATE-END"])
             ms.jdmid = (ms.jdbeg + ms.jdend) / 2.0
         elif hdr["DATE-OBS"] != "":
-            ms.jdmid = datetime2jd(hdr["DATE-OBS"], format="isot", tz_correction=8)
+            ms.jdmid = _datetime2jd(hdr["DATE-OBS"])
         ms.bjdmid = jd2bjd(ms.ra, ms.dec, ms.jdmid)
         return ms
 
@@ -348,24 +518,26 @@ class MrsSpec:
                 )
                 self.ivar_norm = self.ivar * self.flux_cont**2
                 self.flux_norm_err = self.flux_err / self.flux_cont
+                self.isnormalized = True
             else:
+                self.isnormalized = False
                 self.norm_type = norm_type
                 self.norm_kwargs.update(norm_kwargs)
                 # normalize spectrum
-                self.flux_norm = np.array([], dtype=float)
-                self.flux_cont = np.array([], dtype=float)
-                self.ivar_norm = np.array([], dtype=float)
-                self.flux_norm_err = np.array([], dtype=float)
+                self.flux_norm = _EMPTY_F64
+                self.flux_cont = _EMPTY_F64
+                self.ivar_norm = _EMPTY_F64
+                self.flux_norm_err = _EMPTY_F64
 
         else:
             # for empty spec
             # update norm kwargs
             self.norm_kwargs.update(norm_kwargs)
             # normalize spectrum
-            self.flux_norm = np.array([], dtype=float)
-            self.flux_cont = np.array([], dtype=float)
-            self.ivar_norm = np.array([], dtype=float)
-            self.flux_norm_err = np.array([], dtype=float)
+            self.flux_norm = _EMPTY_F64
+            self.flux_cont = _EMPTY_F64
+            self.ivar_norm = _EMPTY_F64
+            self.flux_norm_err = _EMPTY_F64
             return
 
     def wave_rv(self, rv=None):
@@ -387,11 +559,12 @@ class MrsSpec:
 
     def interp_then_norm(self, new_wave, rv=None):
         """interpolate to a new wavelength grid"""
-        flux_interp = np.interp(new_wave, self.wave_rv(rv), self.flux)
+        wave_rv = self.wave_rv(rv)
+        flux_interp = np.interp(new_wave, wave_rv, self.flux)
         flux_norm, flux_cont = normalize_spectrum_general(
             new_wave, flux_interp, norm_type=self.norm_type, **self.norm_kwargs
         )
-        flux_norm_err = np.interp(new_wave, self.wave_rv(rv), self.flux_err) / flux_cont
+        flux_norm_err = np.interp(new_wave, wave_rv, self.flux_err) / flux_cont
         return flux_norm, flux_norm_err
 
     def interp_norm(self, new_wave, rv=None):
@@ -464,15 +637,22 @@ class MrsSpec:
         mask = self.mask[npix0:npix1] > 0  # positive for bad pixels
         # remove cosmic rays if cr is True, also fill the negative pixels with 0.
         if cr:
-            flux_obs = np.where(self.flux > 0, self.flux, 0.0)
-            flux_obs = debad(self.wave, flux_obs, nsigma=nsigma, maxiter=maxiter)[
-                npix0:npix1
-            ]
-            indcr = (np.abs(flux_obs - self.flux[npix0:npix1]) > 1e-5) * 1
+            # debad runs on the full spectrum so that its edge effects
+            # (zero-padded filters) fall in the cushion that is cut away
+            flux_obs, indrep = debad(
+                self.wave,
+                np.where(self.flux > 0, self.flux, 0.0),
+                nsigma=nsigma,
+                maxiter=maxiter,
+                return_mask=True,
+            )
+            flux_obs = flux_obs[npix0:npix1]
+            # replaced by debad, or negative pixels filled with 0
+            indcr = indrep[npix0:npix1] | (self.flux[npix0:npix1] < -1e-5)
         else:
             flux_obs = self.flux[npix0:npix1]
             flux_obs = np.where(flux_obs > 0, flux_obs, 0.0)
-            indcr = np.zeros(flux_obs.shape, dtype=int)
+            indcr = np.zeros(flux_obs.shape, dtype=bool)
 
         # use new wavelength grid if wave_new is specified
         wave_obsz0 = wave_obs / (1 + rv / SOL_kms)
@@ -487,7 +667,7 @@ class MrsSpec:
 
         flux_obs = np.interp(wave_new, wave_obsz0, flux_obs)
         flux_err = np.interp(wave_new, wave_obsz0, flux_err)
-        mask = 1 * (np.interp(wave_new, wave_obsz0, mask | indcr) > 0)
+        mask = np.interp(wave_new, wave_obsz0, mask | indcr) > 0
 
         msr = MrsSpec()
         msr.wave = wave_new
@@ -533,14 +713,23 @@ class MrsSpec:
 class MrsEpoch:
     """MRS epoch spcetrum"""
 
-    nspec = 0
-    speclist = []
-    specnames = []
+    # attributes set in every __init__ are slots, __dict__ keeps the
+    # file info set in MrsFits.get_one_epoch and others set on the fly
+    __slots__ = _SPEC_FIELDS + (
+        "nspec",
+        "epoch",
+        "speclist",
+        "specnames",
+        "snr",
+        "norm_kwargs",
+        "_norm_key",
+        "__dict__",
+    )
+
     # the most important attributes
-    epoch = -1
     lmjm = 0
-    snr = []
     rv = 0.0
+    isnormalized = False
 
     # time and position info
     filename = ""
@@ -557,20 +746,6 @@ class MrsEpoch:
     jdmid_delta = 0.0
     bjdmid = 0.0
 
-    wave = np.array([], dtype=float)
-    flux = np.array([], dtype=float)
-    ivar = np.array([], dtype=float)
-    mask = np.array([], dtype=int)
-    flux_err = np.array([], dtype=float)
-
-    flux_norm = np.array([], dtype=float)
-    ivar_norm = np.array([], dtype=float)
-    flux_cont = np.array([], dtype=float)
-    flux_norm_err = np.array([], dtype=float)
-
-    # # default settings for normalize_spectrum_iter/poly
-    norm_kwargs = {}
-
     def __init__(
         self, speclist, specnames=("B", "R"), epoch=-1, norm_type=None, **norm_kwargs
     ):
@@ -591,8 +766,10 @@ class MrsEpoch:
         # set epoch
         self.epoch = epoch
 
-        # update norm kwargs
-        self.norm_kwargs.update(norm_kwargs)
+        # norm kwargs of this epoch
+        self.norm_kwargs = dict(norm_kwargs)
+        # settings of the last normalization, see _norm_cache_key
+        self._norm_key = None
 
         self.nspec = len(speclist)
         # default name is spec order
@@ -614,10 +791,38 @@ class MrsEpoch:
             s += "\n{}".format(self.speclist[i])
         return s
 
-    def normalize(self, llim=0.0, norm_type=None, **norm_kwargs):
-        """normalize each spectrum with (optional) new settings"""
+    def __getattr__(self, name):
+        """per-spectrum attributes with spectrum name as suffix, e.g.,
+        self.flux_norm_B is self.speclist[self.specnames.index("B")].flux_norm
+        """
+        if not name.startswith("_") and name not in ("speclist", "specnames"):
+            for spec, specname in zip(self.speclist, self.specnames):
+                field = name.removesuffix("_{}".format(specname))
+                if field != name and field in _SPEC_FIELDS:
+                    return getattr(spec, field)
+        raise AttributeError(
+            "'{}' object has no attribute '{}'".format(type(self).__name__, name)
+        )
+
+    def normalize(self, llim=0.0, norm_type=None, force=False, **norm_kwargs):
+        """normalize each spectrum with (optional) new settings
+
+        Parameters
+        ----------
+        llim:
+            flux below llim is set to llim before normalization
+        norm_type:
+            normalization type
+        force:
+            Nothing is done if the settings are the same as the last call,
+            set force=True to renormalize and rebuild the concatenated
+            spectrum after replacing or editing spectra in speclist.
+        """
         # update norm kwargs
         self.norm_kwargs.update(norm_kwargs)
+        norm_key = _norm_cache_key(llim, norm_type, self.norm_kwargs)
+        if not force and norm_key is not None and norm_key == self._norm_key:
+            return
 
         # normalize each spectrum
         for i_spec in range(self.nspec):
@@ -625,74 +830,20 @@ class MrsEpoch:
                 llim=llim, norm_type=norm_type, **self.norm_kwargs
             )
 
-            # store each spec
-            self.__setattr__(
-                "wave_{}".format(self.specnames[i_spec]), self.speclist[i_spec].wave
-            )
-            self.__setattr__(
-                "flux_{}".format(self.specnames[i_spec]), self.speclist[i_spec].flux
-            )
-            self.__setattr__(
-                "ivar_{}".format(self.specnames[i_spec]), self.speclist[i_spec].ivar
-            )
-            self.__setattr__(
-                "mask_{}".format(self.specnames[i_spec]), self.speclist[i_spec].mask
-            )
-            self.__setattr__(
-                "flux_err_{}".format(self.specnames[i_spec]),
-                self.speclist[i_spec].flux_err,
-            )
-
-            self.__setattr__(
-                "flux_norm_{}".format(self.specnames[i_spec]),
-                self.speclist[i_spec].flux_norm,
-            )
-            self.__setattr__(
-                "ivar_norm_{}".format(self.specnames[i_spec]),
-                self.speclist[i_spec].ivar_norm,
+        # concatenate into one epoch spec, collecting the non-empty spectra in one pass
+        bufs = {field: [] for field in _SPEC_FIELDS}
+        for spec in self.speclist:
+            if not spec.isempty:
+                for field in _SPEC_FIELDS:
+                    bufs[field].append(getattr(spec, field))
+        for field in _SPEC_FIELDS:
+            setattr(
+                self,
+                field,
+                _concatenate(bufs[field], dtype=int if field == "mask" else float),
             )
-            self.__setattr__(
-                "flux_cont_{}".format(self.specnames[i_spec]),
-                self.speclist[i_spec].flux_cont,
-            )
-            self.__setattr__(
-                "flux_norm_err_{}".format(self.specnames[i_spec]),
-                self.speclist[i_spec].flux_norm_err,
-            )
-
-        # combined attributes
-        self.wave = np.array([], dtype=float)
-        self.flux = np.array([], dtype=float)
-        self.ivar = np.array([], dtype=float)
-        self.mask = np.array([], dtype=int)
-        self.flux_err = np.array([], dtype=float)
-
-        self.flux_norm = np.array([], dtype=float)
-        self.ivar_norm = np.array([], dtype=float)
-        self.flux_cont = np.array([], dtype=float)
-        self.flux_norm_err = np.array([], dtype=float)
-
-        # concatenate into one epoch spec
-        for i_spec in range(self.nspec):
-            if not self.speclist[i_spec].isempty:
-                self.wave = np.append(self.wave, self.speclist[i_spec].wave)
-                self.flux = np.append(self.flux, self.speclist[i_spec].flux)
-                self.ivar = np.append(self.ivar, self.speclist[i_spec].ivar)
-                self.mask = np.append(self.mask, self.speclist[i_spec].mask)
-                self.flux_err = np.append(self.flux_err, self.speclist[i_spec].flux_err)
-
-                self.flux_norm = np.append(
-                    self.flux_norm, self.speclist[i_spec].flux_norm
-                )
-                self.ivar_norm = np.append(
-                    self.ivar_norm, self.speclist[i_spec].ivar_norm
-                )
-                self.flux_cont = np.append(
-                    self.flux_cont, self.speclist[i_spec].flux_cont
-                )
-                self.flux_norm_err = np.append(
-                    self.flux_norm_err, self.speclist[i_spec].flux_norm_err
-                )
+        self._norm_key = norm_key
+        self.isnormalized = norm_type is not None
         return
 
     def wave_rv(self, rv=None):
@@ -738,7 +889,9 @@ class MrsEpoch:
             msr = self.speclist[i].reduce(norm_type="spline")
             msr.plot_norm(shift=shift)
 
-    def reduce(self, wave_new_list=None, norm_type="spline", niter=3, **rdc_kwargs):
+    def reduce(
+        self, wave_new_list=None, norm_type="spline", niter=3, n_jobs=1, **rdc_kwargs
+    ):
         """
 
         Parameters
@@ -749,6 +902,8 @@ class MrsEpoch:
             type of normalization
         niter:
             number of iteration in normalization
+        n_jobs:
+            number of threads used to reduce the spectra, defaults to 1
 
         Returns
         -------
@@ -757,23 +912,25 @@ class MrsEpoch:
 
         """
         if wave_new_list is None:
-            mer = MrsEpoch(
-                [self.speclist[i].reduce(**rdc_kwargs) for i in range(self.nspec)],
-                specnames=self.specnames,
-                norm_type=norm_type,
-                niter=niter,
-            )
+            tasks = [
+                joblib.delayed(self.speclist[i].reduce)(**rdc_kwargs)
+                for i in range(self.nspec)
+            ]
         else:
             assert len(wave_new_list) == self.nspec
-            mer = MrsEpoch(
-                [
-                    self.speclist[i].reduce(wave_new=wave_new_list[i], **rdc_kwargs)
-                    for i in range(self.nspec)
-                ],
-                specnames=self.specnames,
-                norm_type=norm_type,
-                niter=niter,
-            )
+            tasks = [
+                joblib.delayed(self.speclist[i].reduce)(
+                    wave_new=wave_new_list[i], **rdc_kwargs
+                )
+                for i in range(self.nspec)
+            ]
+        # numerical work only, plotting is never run in threads
+        mer = MrsEpoch(
+            joblib.Parallel(n_jobs=n_jobs, prefer="threads")(tasks),
+            specnames=self.specnames,
+            norm_type=norm_type,
+            niter=niter,
+        )
         # header info
         mer.epoch = self.epoch
         mer.lmjm = self.lmjm
@@ -818,13 +975,28 @@ class MrsFits(fits.HDUList):
             raise RuntimeError("@MrsSpec: file not found! ", fp)
         else:
             self.filepath = fp
-        # read HDU list
-        super().__init__(fits.open(fp))
+        # read HDU list, data are memory-mapped and only loaded on access,
+        # the opened HDUList owns the file and is closed in self.close()
+        self._hdul = fits.open(
+            fp, memmap=True, lazy_load_hdus=True, do_not_scale_image_data=True
+        )
+        # all headers are read here, the HDU names are needed anyway
+        super().__init__(self._hdul)
         # get HDU names
         self.nhdu = len(self)
         self.hdunames = [hdu.name for hdu in self]
         self.ulmjm = []
+        self._classify_hdus()
+
+    def close(self, *args, **kwargs):
+        """close the file, see astropy.io.fits.HDUList.close"""
+        super().close(*args, **kwargs)
+        self._hdul.close(*args, **kwargs)
 
+    def _classify_hdus(self):
+        """classify HDUs by name"""
+        # for O(1) membership tests in get_one_epoch
+        self._hdunames_set = set(self.hdunames)
         self.isB = np.zeros(self.nhdu, dtype=bool)
         self.isR = np.zeros(self.nhdu, dtype=bool)
         self.isEpoch = np.zeros(self.nhdu, dtype=bool)
@@ -849,10 +1021,31 @@ class MrsFits(fits.HDUList):
                 raise RuntimeError("@MrsSpec: error during processing HDU name")
 
     def __repr__(self):
+        """summarize the HDUs from the cached HDU names and flags
+
+        No header is touched, use *detailed_info* for the full summary.
+        """
+        results = ["No.    Name          Band  Type    LMJM"]
+        format = "{:3d}    {:12}  {:4}  {:6}  {}"
+        for idx in range(self.nhdu):
+            band = "B" if self.isB[idx] else "R" if self.isR[idx] else ""
+            if self.isEpoch[idx]:
+                hdutype = "Epoch"
+            elif self.isCoadd[idx]:
+                hdutype = "Coadd"
+            else:
+                hdutype = ""
+            lmjm = self.lmjm[idx] if self.lmjm[idx] > 0 else ""
+            results.append(
+                format.format(idx, self.hdunames[idx], band, hdutype, lmjm).rstrip()
+            )
+        return "\n".join(results)
+
+    def detailed_info(self):
         """as self.info()
         Summarize the info of the HDUs in this `HDUList`.
-        Note that this function prints its results to the console---it
-        does not return a value.
+        This walks through the header of each HDU and can be slow for files
+        with many HDUs.
         """
         if self._file is None:
             name = "(No file associated with this HDUList)"
@@ -898,15 +1091,17 @@ class MrsFits(fits.HDUList):
         else:
             kB = "B-{}".format(lmjm)
             kR = "R-{}".format(lmjm)
-        # read B & R band spec
-        if kB in self.hdunames:
-            msB = MrsSpec.from_hdu(self[kB], norm_type=norm_type, **norm_kwargs)
+        hasB = kB in self._hdunames_set
+        hasR = kR in self._hdunames_set
+        # read B & R band spec, they are normalized once in MrsEpoch
+        if hasB:
+            msB = MrsSpec.from_hdu(self[kB], norm_type=None, **norm_kwargs)
         else:
-            msB = MrsSpec(norm_type=norm_type, **norm_kwargs)
-        if kR in self.hdunames:
-            msR = MrsSpec.from_hdu(self[kR], norm_type=norm_type, **norm_kwargs)
+            msB = MrsSpec(norm_type=None, **norm_kwargs)
+        if hasR:
+            msR = MrsSpec.from_hdu(self[kR], norm_type=None, **norm_kwargs)
         else:
-            msR = MrsSpec(norm_type=norm_type, **norm_kwargs)
+            msR = MrsSpec(norm_type=None, **norm_kwargs)
         # set epoch info
         me = MrsEpoch(
             (msB, msR),
@@ -929,38 +1124,26 @@ class MrsFits(fits.HDUList):
         )
 
         try:
-            if kB in self.hdunames and kR not in self.hdunames:
-                me.jdbeg = datetime2jd(
-                    self[kB].header["DATE-BEG"], format="isot", tz_correction=8
-                )
-                me.jdend = datetime2jd(
-                    self[kB].header["DATE-END"], format="isot", tz_correction=8
-                )
+            if hasB and not hasR:
+                hdrB = self[kB].header
+                me.jdbeg = _datetime2jd(hdrB["DATE-BEG"])
+                me.jdend = _datetime2jd(hdrB["DATE-END"])
                 me.jdmid = (me.jdbeg + me.jdend) / 2.0
                 me.bjdmid = jd2bjd(me.ra, me.dec, me.jdmid)
-            elif kB not in self.hdunames and kR in self.hdunames:
-                me.jdbeg = datetime2jd(
-                    self[kR].header["DATE-BEG"], format="isot", tz_correction=8
-                )
-                me.jdend = datetime2jd(
-                    self[kR].header["DATE-END"], format="isot", tz_correction=8
-                )
+            elif not hasB and hasR:
+                hdrR = self[kR].header
+                me.jdbeg = _datetime2jd(hdrR["DATE-BEG"])
+                me.jdend = _datetime2jd(hdrR["DATE-END"])
                 me.jdmid = (me.jdbeg + me.jdend) / 2.0
                 me.bjdmid = jd2bjd(me.ra, me.dec, me.jdmid)
-            elif kB in self.hdunames and kR in self.hdunames:
+            elif hasB and hasR:
                 # both records
-                jdbeg_B = datetime2jd(
-                    self[kB].header["DATE-BEG"], format="isot", tz_correction=8
-                )
-                jdend_B = datetime2jd(
-                    self[kB].header["DATE-END"], format="isot", tz_correction=8
-                )
-                jdbeg_R = datetime2jd(
-                    self[kR].header["DATE-BEG"], format="isot", tz_correction=8
-                )
-                jdend_R = datetime2jd(
-                    self[kR].header["DATE-END"], format="isot", tz_correction=8
-                )
+                hdrB = self[kB].header
+                hdrR = self[kR].header
+                jdbeg_B = _datetime2jd(hdrB["DATE-BEG"])
+                jdend_B = _datetime2jd(hdrB["DATE-END"])
+                jdbeg_R = _datetime2jd(hdrR["DATE-BEG"])
+                jdend_R = _datetime2jd(hdrR["DATE-END"])
                 jdmid_B = (jdbeg_B + jdend_B) / 2.0
                 jdmid_R = (jdbeg_R + jdend_R) / 2.0
                 jdmid_delta = jdmid_B - jdmid_R
@@ -1008,19 +1191,92 @@ class MrsFits(fits.HDUList):
         return _snr
 
 
+class _FitsioHDU:
+    """astropy-like view of a fitsio HDU, header and data are read on access"""
+
+    def __init__(self, hdu):
+        self._hdu = hdu
+        self._header = None
+        self.name = hdu.get_extname()
+
+    @property
+    def header(self):
+        if self._header is None:
+            self._header = self._hdu.read_header()
+        return self._header
+
+    @property
+    def data(self):
+        return self._hdu.read()
+
+
+class MrsFitsio:
+    """MrsFits with the optional *fitsio* (CFITSIO) backend
+
+    Headers and tables are parsed in C, which is faster for bulk reads of
+    many small files. The epoch methods are shared with MrsFits.
+    """
+
+    def __init__(self, fp):
+        """set file path and read HDU names"""
+        import fitsio
+
+        if not os.path.exists(fp):
+            raise RuntimeError("@MrsSpec: file not found! ", fp)
+        self.filepath = fp
+        self._fits = fitsio.FITS(fp)
+        self._hdus = [_FitsioHDU(hdu) for hdu in self._fits]
+        self.nhdu = len(self._hdus)
+        self.hdunames = [hdu.name for hdu in self._hdus]
+        self.ulmjm = []
+        self._classify_hdus()
+
+    def __len__(self):
+        return self.nhdu
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            key = self.hdunames.index(key)
+        return self._hdus[key]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self._fits.close()
+
+    _classify_hdus = MrsFits._classify_hdus
+    __repr__ = MrsFits.__repr__
+    get_one_spec = MrsFits.get_one_spec
+    get_one_epoch = MrsFits.get_one_epoch
+    get_all_epochs = MrsFits.get_all_epochs
+    ls_epoch = MrsFits.ls_epoch
+    ls_snr = MrsFits.ls_snr
+    epoch = MrsFits.epoch
+    snr = MrsFits.snr
+
+
 class MrsSource(np.ndarray):
     """array of MrsEpoch instances,"""
 
-    mes = []  # MrsEpoch list #
     name = ""  # source name
 
+    @property
+    def mes(self):
+        """MrsEpoch list"""
+        return list(self)
+
     @property
     def snr(self):
+        # MrsEpoch.snr is a per-spectrum list, not a scalar
         return np.array([_.snr for _ in self], dtype=float)
 
     @property
     def epoch(self):
-        return np.array([_.epoch for _ in self], dtype=float)
+        return self._scalar_attr("epoch")
 
     @property
     def nepoch(self):
@@ -1028,7 +1284,19 @@ class MrsSource(np.ndarray):
 
     @property
     def rv(self):
-        return np.array([_.rv for _ in self], dtype=float)
+        return self._scalar_attr("rv")
+
+    def _scalar_attr(self, name, dtype=float):
+        """collect an attribute of all epochs into an array
+
+        With dtype=None the dtype is inferred as in np.array, which is needed
+        for non-numeric attributes, e.g., filename.
+        """
+        if dtype is None:
+            return np.array([getattr(_, name) for _ in self])
+        return np.fromiter(
+            (getattr(_, name) for _ in self), dtype=dtype, count=len(self)
+        )
 
     def __new__(cls, data, name="", norm_type=None, **norm_kwargs):
         # prepare
@@ -1041,8 +1309,10 @@ class MrsSource(np.ndarray):
         msrc = super(MrsSource, cls).__new__(
             cls, buffer=data, dtype=data.dtype, shape=data.shape
         )
-        # normalize if necessary
-        msrc.normalize(norm_type=norm_type, **norm_kwargs)
+        # normalize if necessary, epochs already normalized with the same
+        # settings are skipped in MrsEpoch.normalize
+        if norm_type is not None:
+            msrc.normalize(norm_type=norm_type, **norm_kwargs)
         return msrc
 
     # def __repr__(self):
@@ -1053,17 +1323,45 @@ class MrsSource(np.ndarray):
     #     return s
 
     @staticmethod
-    def glob(fmt, norm_type=None, **norm_kwargs):
+    def glob(fmt, norm_type=None, use_fitsio=False, n_jobs=1, **norm_kwargs):
         fps = glob.glob(fmt)
         fps.sort()
-        return MrsSource.read(fps, norm_type=norm_type, **norm_kwargs)
+        return MrsSource.read(
+            fps,
+            norm_type=norm_type,
+            use_fitsio=use_fitsio,
+            n_jobs=n_jobs,
+            **norm_kwargs,
+        )
 
     @staticmethod
-    def read(fps, norm_type=None, **norm_kwargs):
-        mes = []
-        for fp in fps:
-            mf = MrsFits(fp)
-            mes.extend(mf.get_all_epochs(norm_type=norm_type, **norm_kwargs))
+    def read(fps, norm_type=None, use_fitsio=False, n_jobs=1, **norm_kwargs):
+        """read epochs from MRS files
+
+        Parameters
+        ----------
+        fps:
+            file paths
+        norm_type:
+            normalization type
+        use_fitsio:
+            if True, read with the optional *fitsio* backend (MrsFitsio),
+            fall back to astropy (MrsFits) if *fitsio* is not installed.
+        n_jobs:
+            number of processes to read files in parallel, see joblib.Parallel
+        """
+        reader = MrsFits
+        if use_fitsio and importlib.util.find_spec("fitsio") is not None:
+            reader = MrsFitsio
+        if n_jobs == 1:
+            mes_list = [_read_epochs(reader, fp, norm_type, norm_kwargs) for fp in fps]
+        else:
+            # files are independent, epochs are pickled back as plain arrays
+            mes_list = joblib.Parallel(n_jobs=n_jobs)(
+                joblib.delayed(_read_epochs)(reader, fp, norm_type, norm_kwargs)
+                for fp in fps
+            )
+        mes = [me for mes_file in mes_list for me in mes_file]
         return MrsSource(mes, norm_type=norm_type, **norm_kwargs)
 
     def normalize(self, norm_type=None, **norm_kwargs):
@@ -1074,18 +1372,18 @@ class MrsSource(np.ndarray):
 
     @property
     def jdmid(self):
-        return np.array([_.__getattribute__("jdmid") for _ in self])
+        return self._scalar_attr("jdmid")
 
     @property
     def bjdmid(self):
-        return np.array([_.__getattribute__("bjdmid") for _ in self])
+        return self._scalar_attr("bjdmid")
 
     @property
     def jdltt(self):
-        return np.array([_.__getattribute__("jdltt") for _ in self])
+        return self._scalar_attr("jdltt")
 
     def getkwd(self, k):
-        return np.array([_.__getattribute__(k) for _ in self])
+        return self._scalar_attr(k, dtype=None)
 
     def shiftplot(self, shift=1.0):
         fig = plt.figure()
@@ -1094,6 +1392,31 @@ class MrsSource(np.ndarray):
         return fig
 
 
+def _read_epochs(reader, fp, norm_type, norm_kwargs):
+    """read all epochs of one file with *reader* (MrsFits or MrsFitsio)"""
+    # close the file once its epochs are read
+    with reader(fp) as mf:
+        return mf.get_all_epochs(norm_type=norm_type, **norm_kwargs)
+
+
+def _norm_cache_key(llim, norm_type, norm_kwargs):
+    """hashable key of normalization settings, None if a value is unhashable"""
+    try:
+        key = (llim, norm_type, frozenset(norm_kwargs.items()))
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _concatenate(arrays, dtype=float):
+    """concatenate arrays in one allocation, the result dtype is promoted
+    from *dtype* as with repeated np.append to an empty array"""
+    if len(arrays) == 0:
+        return np.array([], dtype=dtype)
+    return np.concatenate(arrays, dtype=np.result_type(dtype, *arrays))
+
+
 def get_kwd_safe(hdr, key, fallback=0.0):
     try:
         return hdr[key]
@@ -87,7 +87,7 @@ def normalize_spectrum(wave, flux, norm_range, dwave,
         ind_good_init = 1. * (ivar > 0.) * (flux > 0.)
     else:
         ind_good_init = 1. * (flux > 0.)
-    ind_good_init = ind_good_init.astype(np.bool)
+    ind_good_init = ind_good_init.astype(bool)
     # print("@Cham: sum(ind_good_init)", np.sum(ind_good_init))
 
     flux_smoothed1 = SmoothSpline(wave[ind_good_init], flux[ind_good_init],
@@ -95,7 +95,7 @@ def normalize_spectrum(wave, flux, norm_range, dwave,
     dflux = flux - flux_smoothed1
 
     # collecting continuum pixels --> ITERATION 1
-    ind_good = np.zeros(wave.shape, dtype=np.bool)
+    ind_good = np.zeros(wave.shape, dtype=bool)
     for i_bin in range(n_bin):
         ind_bin = np.logical_and(wave > wave1 + (i_bin - 0.5) * dwave,
                                  wave <= wave1 + (i_bin + 0.5) * dwave)
@@ -115,7 +115,7 @@ def normalize_spectrum(wave, flux, norm_range, dwave,
         assert np.sum(ind_good) > 0
     except AssertionError:
         Warning("@Keenan.normalize_spectrum(): unable to find continuum!")
-        ind_good = np.ones(wave.shape, dtype=np.bool)
+        ind_good = np.ones(wave.shape, dtype=bool)
 
     # SMOOTH 2
     # continuum flux
@@ -213,7 +213,7 @@ def normalize_spectrum_spline(wave, flux, p=1E-6, q=0.5, lu=(-1, 3), binwidth=30
             assert np.sum(ind_good) > 0
         except AssertionError:
             Warning("@normalize_spectrum_iter: unable to find continuum!")
-            ind_good = np.ones(wave.shape, dtype=np.bool)
+            ind_good = np.ones(wave.shape, dtype=bool)
 
     # final smoothing
     flux_smoothed2 = SmoothSpline(
@@ -374,7 +374,7 @@ def normalize_spectrum_poly(wave, flux, deg=10, pw=1., lu=(-1, 4), q=0.5, binwid
             assert np.sum(ind_good) > 0
         except AssertionError:
             Warning("@normalize_spectrum_iter: unable to find continuum!")
-            ind_good = np.ones(wave.shape, dtype=np.bool)
+            ind_good = np.ones(wave.shape, dtype=bool)
 
     # final smoothing
     flux_smoothed2 = PolySmooth(wave[ind_good], flux[ind_good], deg=deg, pw=pw)(wave)
@@ -144,13 +144,13 @@ def _xtick_pos_lab(
         raise ValueError("@Cham: xtick_label_type is wrong!")
 
     for i_chunk in xrange(n_chunks):
-        n_xtick_l = np.int(
+        n_xtick_l = int(
             np.abs(
                 (wave_centers[i_chunk] - wave_intervals[i_chunk][0])
                 / xtick_pos_step[i_chunk]
             )
         )
-        n_xtick_r = np.int(
+        n_xtick_r = int(
             np.abs(
                 (wave_centers[i_chunk] - wave_intervals[i_chunk][1])
                 / xtick_pos_step[i_chunk]
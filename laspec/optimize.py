@@ -45,7 +45,7 @@ class RandomWalkMinimizer:
         self.xhist = []
 
     def __call__(self, x):
-        return np.float(self.fun(np.array(x), *self.args, **self.kwargs))
+        return float(self.fun(np.array(x), *self.args, **self.kwargs))
 
     def run(self, fun=None, x0=None, dx=None, maxiter=None, args=None,
             kwargs=None, optind=None, verbose=None, random=None):
@@ -56,10 +56,10 @@ def Rotation_kernel(dRV_sampling=10, vsini=100, epsilon=0.6, osr_kernel=3):
     rotation kernel
 
     """
-    osr_kernel = np.int(np.floor(osr_kernel / 2)) * 2 + 1  # an odd number
+    osr_kernel = int(np.floor(osr_kernel / 2)) * 2 + 1  # an odd number
     # determine X
-    npix_half = np.int(np.floor(vsini / dRV_sampling))
-    npix_half = np.int(npix_half * osr_kernel + 0.5 * (osr_kernel - 1))
+    npix_half = int(np.floor(vsini / dRV_sampling))
+    npix_half = int(npix_half * osr_kernel + 0.5 * (osr_kernel - 1))
     # npix = 2 * npix_half + 1
     vvl = np.arange(-npix_half, npix_half + 1) / osr_kernel * dRV_sampling / vsini
 
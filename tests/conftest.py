@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+from astropy.io import fits
+
+from laspec import mrs
+
+
+def make_mrs_fits(fp, npix=1000, loglam=False):
+    """write a small MRS file with coadd and two epochs, one of them B only
+
+    With loglam=True the old format (until DR9 v0) is written, i.e., one row
+    per pixel with LOGLAM in decreasing order.
+    """
+    rng = np.random.default_rng(0)
+    hl = fits.HDUList([fits.PrimaryHDU()])
+    hl[0].header["EXTNAME"] = "Information"
+    hl[0].header["FILENAME"] = "test.fits"
+    hl[0].header["OBSID"] = 1
+    hl[0].header["SEEING"] = 2.0
+    hl[0].header["RA"] = 10.0
+    hl[0].header["DEC"] = 20.0
+    for name, w0, lmjm in [
+        ("COADD_B", 4950, 84420148),
+        ("COADD_R", 6300, 84420148),
+        ("B-84420148", 4950, 84420148),
+        ("R-84420148", 6300, 84420148),
+        ("B-84420160", 4950, 84420160),
+    ]:
+        wave = np.linspace(w0, w0 + 400, npix)
+        flux = 1000 * (1 + 0.1 * np.sin(wave / 50)) + rng.normal(0, 10, npix)
+        ivar = np.full(npix, 1e-2)
+        mask = np.zeros(npix, dtype=np.int32)
+        mask[100:105] = 1
+        if loglam:
+            cols = [
+                fits.Column("LOGLAM", "D", array=np.log10(wave)[::-1]),
+                fits.Column("FLUX", "E", array=flux[::-1]),
+                fits.Column("IVAR", "E", array=ivar[::-1]),
+                fits.Column("ORMASK", "J", array=mask[::-1]),
+                fits.Column("PIXMASK", "J", array=mask[::-1]),
+            ]
+        else:
+            cols = [
+                fits.Column("WAVELENGTH", f"{npix}D", array=wave[None]),
+                fits.Column("FLUX", f"{npix}E", array=flux[None]),
+                fits.Column("IVAR", f"{npix}E", array=ivar[None]),
+                fits.Column("ORMASK", f"{npix}J", array=mask[None]),
+                fits.Column("PIXMASK", f"{npix}J", array=mask[None]),
+            ]
+        hdu = fits.BinTableHDU.from_columns(cols, name=name)
+        hdu.header["LMJM"] = lmjm
+        hdu.header["EXPTIME"] = 900.0
+        hdu.header["SNR"] = 50.0
+        hdu.header["LAMPLIST"] = "test"
+        hdu.header["DATE-BEG"] = "2018-01-01T12:00:00.0"
+        hdu.header["DATE-END"] = "2018-01-01T12:15:00.0"
+        hl.append(hdu)
+    hl.writeto(fp)
+    return fp
+
+
+@pytest.fixture
+def offline_bjd(monkeypatch):
+    # the barycentric correction needs the observatory location online
+    monkeypatch.setattr(mrs, "jd2bjd", lambda ra, dec, jd: jd)
+
+
+@pytest.fixture
+def fp_mrs(tmp_path, offline_bjd):
+    return make_mrs_fits(str(tmp_path / "test.fits"))
+
+
+@pytest.fixture
+def fp_mrs_loglam(tmp_path, offline_bjd):
+    return make_mrs_fits(str(tmp_path / "test_loglam.fits"), loglam=True)
+
+
+def assert_epochs_equal(me0, me1):
+    for k in ["wave", "flux", "ivar", "mask", "flux_err", "flux_norm"]:
+        np.testing.assert_array_equal(getattr(me0, k), getattr(me1, k), err_msg=k)
+    for k in ["nspec", "epoch", "snr", "jdbeg", "jdend", "jdmid", "bjdmid"]:
+        np.testing.assert_array_equal(getattr(me0, k), getattr(me1, k), err_msg=k)
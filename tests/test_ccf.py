@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from laspec.ccf import xcorr_spec_rvgrid, xcorr_spec_rvgrid_batch
+
+
+@pytest.fixture
+def spec():
+    rng = np.random.default_rng(0)
+    wave_mod = np.linspace(5000, 5300, 3000)
+    flux_mod = 1 - 0.3 * np.exp(
+        -0.5 * ((wave_mod - rng.uniform(5050, 5250, (5, 1))) / 0.5) ** 2
+    )
+    wave_obs = np.linspace(5050, 5250, 1500)
+    flux_obs = np.interp(wave_obs, wave_mod * (1 + 20 / 299792.458), flux_mod[2])
+    flux_obs += rng.normal(0, 0.01, wave_obs.size)
+    return wave_obs, flux_obs, wave_mod, flux_mod
+
+
+@pytest.mark.parametrize("dtype", [float, np.float32])
+@pytest.mark.parametrize("rv_grid", [(-100, 100, 5), np.linspace(-100, 100, 41)])
+def test_xcorr_spec_rvgrid_batch(spec, dtype, rv_grid):
+    wave_obs, flux_obs, wave_mod, flux_mod = spec
+    flux_mod = flux_mod.astype(dtype)
+    ccf_loop = np.array(
+        [xcorr_spec_rvgrid(wave_obs, flux_obs, wave_mod, _, rv_grid) for _ in flux_mod]
+    )
+    # list inputs are accepted as in xcorr_spec_rvgrid
+    ccf_batch = xcorr_spec_rvgrid_batch(
+        list(wave_obs), list(flux_obs), wave_mod, flux_mod, rv_grid
+    )
+    assert ccf_batch.shape == (5, 41)
+    np.testing.assert_allclose(ccf_batch, ccf_loop, rtol=0, atol=1e-13)
+    # the best template and RV
+    imod, irv = np.unravel_index(np.argmax(ccf_batch), ccf_batch.shape)
+    assert imod == 2
+    assert irv == 24
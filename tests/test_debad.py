@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+from scipy.signal import medfilt
+from scipy.signal.windows import gaussian
+
+from laspec.mrs import debad
+
+
+def debad_reference(
+    wave, fluxnorm, nsigma=(4, 8), mfarg=21, gfarg=(51, 9), maskconv=7, maxiter=3
+):
+    """the original debad with medfilt and np.convolve, also returns indrep"""
+    npix = len(fluxnorm)
+    indclip = np.zeros_like(fluxnorm, dtype=bool)
+    indrep = np.zeros_like(fluxnorm, dtype=bool)
+    countiter = 0
+    while True:
+        fluxmf = medfilt(fluxnorm, mfarg)
+        gk = gaussian(5, 0.5)
+        gk /= np.sum(gk)
+        fluxmf = np.convolve(fluxmf, gk, "same")
+        fluxres = fluxnorm - fluxmf
+        gk = gaussian(*gfarg)
+        gk /= np.sum(gk)
+        fluxsigma = np.convolve(np.abs(fluxres), gk, "same")
+        indout = np.logical_or(
+            fluxres > fluxsigma * nsigma[0], fluxres < -fluxsigma * nsigma[1]
+        )
+        indclip |= indout
+        if np.sum(indclip) > 0.5 * npix:
+            raise RuntimeError("Too many bad pixels!")
+        countiter += 1
+        if np.sum(indout) == 0 or countiter >= maxiter:
+            return fluxnorm, indrep
+        indout = np.convolve(indout * 1.0, np.ones((maskconv,)), "same") > 0
+        indrep |= indout
+        fluxnorm = np.interp(wave, wave[~indout], fluxnorm[~indout])
+
+
+@pytest.fixture
+def spec():
+    rng = np.random.default_rng(0)
+    wave = np.linspace(5000, 5300, 4000)
+    flux = 1 + 0.05 * np.sin(wave / 7) + rng.normal(0, 0.01, wave.size)
+    # cosmic rays, some of them adjacent
+    flux[rng.integers(0, wave.size, 40)] += 1.0
+    flux[2000:2003] += 2.0
+    # absorption
+    flux[1000] -= 0.5
+    return wave, flux
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(),
+        dict(maxiter=1),
+        dict(maxiter=5),
+        # even mask width
+        dict(maskconv=6),
+        dict(maskconv=1),
+        # long Gaussian kernel, convolved with oaconvolve
+        dict(gfarg=(201, 30)),
+        dict(mfarg=5, gfarg=(151, 20), maskconv=4),
+        dict(nsigma=(2, 3)),
+    ],
+)
+def test_debad(spec, kwargs):
+    wave, flux = spec
+    flux_input = flux.copy()
+    flux_ref, indrep_ref = debad_reference(wave, flux.copy(), **kwargs)
+    flux_new, indrep_new = debad(wave, flux, return_mask=True, **kwargs)
+    # pixels are replaced unless it stops after the first clip
+    assert indrep_ref.any() == (kwargs.get("maxiter", 3) > 1)
+    np.testing.assert_array_equal(flux_new, flux_ref)
+    np.testing.assert_array_equal(indrep_new, indrep_ref)
+    # the input is not modified
+    np.testing.assert_array_equal(flux, flux_input)
+    np.testing.assert_array_equal(debad(wave, flux, **kwargs), flux_ref)
+
+
+def test_debad_too_many_bad_pixels(spec):
+    wave, flux = spec
+    with pytest.raises(RuntimeError):
+        debad(wave, flux, nsigma=(0, 0))
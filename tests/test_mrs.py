@@ -0,0 +1,81 @@
+import joblib
+import numpy as np
+import pytest
+from astropy.io import fits
+from conftest import assert_epochs_equal
+
+from laspec.mrs import MrsFits, MrsSource, MrsSpec
+
+
+def test_mrsspec_from_data(fp_mrs, fp_mrs_loglam):
+    with fits.open(fp_mrs) as hl:
+        ms = MrsSpec.from_data(hl[3].data, hl[3].header, norm_type="spline")
+    ms_hdu = MrsSpec.from_mrs(fp_mrs, "B-84420148", norm_type="spline")
+    np.testing.assert_array_equal(ms.flux_norm, ms_hdu.flux_norm)
+    assert ms.name == "B-84420148"
+    assert ms.lmjm == 84420148
+    assert ms.snr == 50.0
+    assert ms.isnormalized
+    # the old format has LOGLAM in decreasing order
+    ms_loglam = MrsSpec.from_mrs(fp_mrs_loglam, "B-84420148", norm_type="spline")
+    assert np.all(np.diff(ms_loglam.wave) > 0)
+    np.testing.assert_allclose(ms_loglam.wave, ms.wave, rtol=1e-12)
+    np.testing.assert_array_equal(ms_loglam.flux, ms.flux)
+    np.testing.assert_array_equal(ms_loglam.mask, ms.mask)
+    assert ms_loglam.jdmid == ms.jdmid
+
+
+def test_mrsfits_close(fp_mrs):
+    with MrsFits(fp_mrs) as mf:
+        f = mf[1]._file
+        assert not f.closed
+    assert f.closed
+
+
+def test_mrsepoch_getattr(fp_mrs):
+    with MrsFits(fp_mrs) as mf:
+        me = mf.get_one_epoch(84420148, norm_type="spline")
+    msB, msR = me.speclist
+    assert me.specnames == ("B", "R")
+    assert me.flux_norm_B is msB.flux_norm
+    assert me.wave_R is msR.wave
+    np.testing.assert_array_equal(
+        me.flux_norm, np.concatenate([msB.flux_norm, msR.flux_norm])
+    )
+    with pytest.raises(AttributeError):
+        me.flux_norm_X
+    with pytest.raises(AttributeError):
+        me.notafield_B
+
+
+def test_mrsepoch_normalize_force(fp_mrs):
+    with MrsFits(fp_mrs) as mf:
+        me = mf.get_one_epoch(84420148, norm_type="spline")
+    flux, flux_norm = me.flux, me.flux_norm
+    # the same settings are skipped
+    me.normalize(norm_type="spline")
+    assert me.flux_norm is flux_norm
+    # a spectrum edited in place is only picked up with force=True
+    me.speclist[0].flux = me.speclist[0].flux * 2
+    me.normalize(norm_type="spline")
+    assert me.flux is flux
+    me.normalize(norm_type="spline", force=True)
+    np.testing.assert_array_equal(
+        me.flux, np.concatenate([me.speclist[0].flux, me.speclist[1].flux])
+    )
+    # new settings renormalize
+    me.normalize(norm_type="poly")
+    assert me.flux_norm is not flux_norm
+    assert me.isnormalized
+
+
+def test_mrssource_read_n_jobs(fp_mrs, fp_mrs_loglam):
+    fps = [fp_mrs, fp_mrs_loglam]
+    msrc1 = MrsSource.read(fps, norm_type="spline")
+    # threads, so that the patched jd2bjd is used by the workers
+    with joblib.parallel_backend("threading"):
+        msrc2 = MrsSource.read(fps, norm_type="spline", n_jobs=2)
+    assert msrc1.nepoch == msrc2.nepoch == 4
+    np.testing.assert_array_equal(msrc1.epoch, msrc2.epoch)
+    for me1, me2 in zip(msrc1, msrc2):
+        assert_epochs_equal(me1, me2)
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+from conftest import assert_epochs_equal
+
+from laspec.mrs import MrsFits, MrsFitsio, MrsSource, MrsSpec
+
+fitsio = pytest.importorskip("fitsio")
+
+
+def test_mrsfitsio_epochs(fp_mrs):
+    with MrsFits(fp_mrs) as mf0, MrsFitsio(fp_mrs) as mf1:
+        np.testing.assert_array_equal(mf0.lmjm, mf1.lmjm)
+        np.testing.assert_array_equal(mf0.isB, mf1.isB)
+        np.testing.assert_array_equal(mf0.isR, mf1.isR)
+        mes0 = mf0.get_all_epochs(including_coadd=True, norm_type="spline")
+        mes1 = mf1.get_all_epochs(including_coadd=True, norm_type="spline")
+    assert len(mes0) == len(mes1) == 3
+    for me0, me1 in zip(mes0, mes1):
+        assert_epochs_equal(me0, me1)
+
+
+def test_mrssource_read_fitsio(fp_mrs):
+    msrc0 = MrsSource.read([fp_mrs], norm_type="spline")
+    msrc1 = MrsSource.read([fp_mrs], norm_type="spline", use_fitsio=True)
+    assert msrc0.nepoch == msrc1.nepoch
+    for me0, me1 in zip(msrc0, msrc1):
+        assert_epochs_equal(me0, me1)
+
+
+def test_mrsspec_from_mrs_fitsio(fp_mrs):
+    ms0 = MrsSpec.from_mrs(fp_mrs, "B-84420160", norm_type="spline")
+    ms1 = MrsSpec.from_mrs_fitsio(fp_mrs, "B-84420160", norm_type="spline")
+    for k in ["wave", "flux", "ivar", "mask", "flux_norm", "flux_norm_err"]:
+        np.testing.assert_array_equal(getattr(ms0, k), getattr(ms1, k), err_msg=k)
+    assert ms0.lmjm == ms1.lmjm
+    assert ms0.jdmid == ms1.jdmid